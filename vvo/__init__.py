@@ -1,3 +1,4 @@
 from .api_stops import *
 from .api_departure import *
 from .api_route import *
+from .base import close
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-from typing import Union
+from functools import partial as _partial
+from time import time as _time
+from typing import Iterable as _Iterable, Optional as _Optional, Union
 from .api_stops import Point
-from .base import Response, _do_request, _parse_time
+from .base import Response, _coerce_time, _do_request, _parse_time
 
 _ENDPOINT = "/dm"
 
@@ -40,13 +43,39 @@ class TransportationType(Enum):
     RAMP_DOWN = "MobilityRampDown"
 
 
+_MOT_BY_VALUE = {m.value: m for m in TransportationType}
+
+
 class Punctuality(Enum):
     IN_TIME = "InTime"
     DELAYED = "Delayed"
     CANCELLED = "Cancelled"
 
 
+_PUNCT_BY_VALUE = {p.value: p for p in Punctuality}
+
+
+def _to_mot(value: str) -> TransportationType:
+    # Fall back to the enum for unknown values to raise its ValueError
+    return _MOT_BY_VALUE.get(value) or TransportationType(value)
+
+
+def _to_punctuality(value: str) -> Punctuality:
+    return _PUNCT_BY_VALUE.get(value) or Punctuality(value)
+
+
+def _serialize_vehicles(
+    vehicles: Union[TransportationType, str, _Iterable[Union[TransportationType, str]]]
+) -> list[str]:
+    """Convert means of transportation to their API values"""
+    if isinstance(vehicles, (TransportationType, str)):
+        vehicles = [vehicles]
+    return [v.value if isinstance(v, TransportationType) else v for v in vehicles]
+
+
 class Departure:
+    __slots__ = ("id", "vehicle", "line_name", "direction", "state", "scheduled", "real_time", "delay", "_departure_ts")
+
     id: str
     """ID of the departure"""
     vehicle: TransportationType
@@ -59,35 +88,32 @@ class Departure:
     """State of the departure"""
     scheduled: datetime
     """Time this departed was scheduled for"""
-    real_time: datetime = None
+    real_time: _Optional[datetime]
     """The real time departure (differs if delayed)"""
-    departure: int
-    """Departure in seconds from now"""
+    delay: int
+    """Delay of the departure in seconds"""
 
     def __init__(self, data: dict):
-        self.id = data.pop("Id")
-        self.vehicle = TransportationType(data.pop("Mot"))
-        self.line_name = data.pop("LineName")
-        self.direction = data.pop("Direction")
-        self.state = Punctuality(data.pop("State", "InTime"))
-        self.scheduled = _parse_time(data.pop("ScheduledTime"))
+        self.id = data["Id"]
+        self.vehicle = _to_mot(data["Mot"])
+        self.line_name = data["LineName"]
+        self.direction = data["Direction"]
+        self.state = _to_punctuality(data.get("State", "InTime"))
+        self.scheduled = _parse_time(data["ScheduledTime"])
         if "RealTime" in data:
-            self.real_time = _parse_time(data.pop("RealTime"))
+            self.real_time = _parse_time(data["RealTime"])
         else:
             self.real_time = None
+        self.delay = int((self.real_time - self.scheduled).total_seconds()) if self.real_time else 0
+        self._departure_ts = self.scheduled.timestamp() + self.delay
         # other data: Diva -> Number + Network
         # RouteChanges [int]
         # Platform: Name + Type
 
-    @property
-    def delay(self):
-        if self.real_time:
-            return int((self.real_time - self.scheduled).total_seconds())
-        return 0
-
     @property
     def departure(self):
-        return int((self.scheduled - datetime.now()).total_seconds() + self.delay)
+        """Departure in seconds from now"""
+        return int(self._departure_ts - _time())
 
 
 class DepartureResponse(Response):
@@ -102,14 +128,18 @@ class DepartureResponse(Response):
 
     def __init__(self, data: dict, parameters: dict):
         super().__init__(data, parameters)
-        self.name = data["Name"]
-        self.place = data["Place"]
-        dd = {}
-        # Filter out duplicates
+        self.name = data.get("Name")
+        self.place = data.get("Place")
+        if not self.ok:
+            self.departures = []
+            self.more = False
+            return
+
+        # Filter out duplicates, the last record wins but keeps the position of the first
+        records = {}
         for d in data.get("Departures", []):
-            dep = Departure(d)
-            dd[(dep.id, dep.scheduled)] = dep
-        self.departures = list(dd.values())
+            records[(d["Id"], d["ScheduledTime"])] = d
+        self.departures = [Departure(d) for d in records.values()]
         self.more = "limit" in parameters and parameters["limit"] == len(self.departures)
 
 
@@ -129,13 +159,19 @@ def get_departures(stopid: Union[Point, int], **kwargs) -> DepartureResponse:
         stopid = stopid.id
 
     if "vehicle" in kwargs:
-        for idx, v in enumerate(kwargs["vehicle"]):
-            if isinstance(v, TransportationType):
-                kwargs["vehicle"][idx] = v.value
-        kwargs["mot"] = kwargs["vehicle"]
-        del kwargs["vehicle"]
+        kwargs["mot"] = _serialize_vehicles(kwargs.pop("vehicle"))
 
-    if "time" in kwargs and isinstance(kwargs["time"], datetime):
-        kwargs["time"] = kwargs["time"].isoformat()
+    if "time" in kwargs:
+        kwargs["time"] = _coerce_time(kwargs["time"])
 
     return _do_request(_ENDPOINT, {"stopid": stopid, **kwargs}, DepartureResponse)
+
+
+def get_departures_many(stopids: _Iterable[Union[Point, int]], **kwargs) -> list[DepartureResponse]:
+    """Get departures on multiple stops concurrently
+
+    Results are returned in the same order as the given stops.
+    Parameters are the same as for `get_departures`.
+    """
+    with _ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(_partial(get_departures, **kwargs), stopids))
@@ -1,16 +1,19 @@
 from dataclasses import dataclass
 from datetime import datetime
+from operator import itemgetter as _itemgetter
 from typing import Optional, Union
 
-from .api_departure import Punctuality, TransportationType
+from .api_departure import _serialize_vehicles, _to_mot, _to_punctuality, Punctuality, TransportationType
 from .api_stops import Point
-from .base import Response, _do_request, _parse_time
+from .base import Response, _coerce_time, _do_request, _parse_time
 
 
 _ENDPOINT = "/tr/trips"
 
+_RS_REQUIRED = _itemgetter("Name", "Place", "DataId", "Type", "ArrivalTime", "DepartureTime", "Latitude", "Longitude")
 
-@dataclass
+
+@dataclass(slots=True)
 class Vehicle:
     """Vehicle used for a route"""
 
@@ -49,7 +52,7 @@ class Vehicle:
           }
         """
         return Vehicle(
-            type=TransportationType(data["Type"]),
+            type=_to_mot(data["Type"]),
             direction=data.get("Direction", None),
             name=data.get("Name", None),
             changes=data.get("Changes", []),
@@ -60,7 +63,26 @@ class Vehicle:
 class RouteStop:
     """Represents a regular stop on a route"""
 
-    @dataclass
+    # Explicit slots so the location cache stays out of the dataclass fields
+    __slots__ = (
+        "name",
+        "place",
+        "point_id",
+        "type",
+        "arrival_scheduled",
+        "arrival_realtime",
+        "arrival_state",
+        "departure_scheduled",
+        "departure_realtime",
+        "departure_state",
+        "platform",
+        "latitude_gk4",
+        "longitude_gk4",
+        "_location",
+        "_route_stops",
+    )
+
+    @dataclass(slots=True)
     class Platform:
         """Represents a platform where a vehicle stops"""
 
@@ -93,12 +115,39 @@ class RouteStop:
     latitude_gk4: int
     longitude_gk4: int
 
+    def __post_init__(self):
+        self._location = None
+        self._route_stops = None
+
     @property
     def location(self):
         """Coordinates in WGS84 (longitude, latitude)"""
-        from .coordinates_utils import from_gk4
+        if self._location is None:
+            if self._route_stops:
+                RouteStop.locations_bulk(self._route_stops)
+            else:
+                from .coordinates_utils import from_gk4
 
-        return from_gk4(self.latitude_gk4, self.longitude_gk4)
+                self._location = from_gk4(self.latitude_gk4, self.longitude_gk4)
+        return self._location
+
+    @staticmethod
+    def locations_bulk(stops: list["RouteStop"]):
+        """Calculate the location of all given stops with a single projection call"""
+        if not stops:
+            return
+        from .coordinates_utils import from_gk4_bulk
+
+        lons, lats = from_gk4_bulk([s.latitude_gk4 for s in stops], [s.longitude_gk4 for s in stops])
+        for stop, lon, lat in zip(stops, lons, lats):
+            stop._location = (lon, lat)
+            stop._route_stops = None
+
+    @staticmethod
+    def _share_locations(stops: list["RouteStop"]):
+        """Project all given stops together once the first location is requested"""
+        for stop in stops:
+            stop._route_stops = stops
 
     @property
     def arrival(self):
@@ -141,26 +190,30 @@ class RouteStop:
             "ArrivalState": "InTime",
             "CancelReasons": []
         }"""
+        name, place, point_id, stop_type, arrival, departure, latitude, longitude = _RS_REQUIRED(data)
+        arrival_state = data.get("ArrivalState")
+        arrival_realtime = data.get("ArrivalRealTime")
+        departure_state = data.get("DepartureState")
+        departure_realtime = data.get("DepartureRealTime")
+        platform = data.get("Platform")
         return RouteStop(
-            name=data["Name"],
-            place=data["Place"],
-            point_id=int(data["DataId"]),
-            type=data["Type"],
-            arrival_scheduled=_parse_time(data["ArrivalTime"]),
-            arrival_state=Punctuality(data["ArrivalState"]) if "ArrivalState" in data else None,
-            arrival_realtime=_parse_time(data["ArrivalRealTime"]) if "ArrivalRealTime" in data else None,
-            departure_scheduled=_parse_time(data["DepartureTime"]),
-            departure_state=Punctuality(data["DepartureState"]) if "DepartureState" in data else None,
-            departure_realtime=_parse_time(data["DepartureRealTime"]) if "DepartureRealTime" in data else None,
-            platform=RouteStop.Platform(data["Platform"]["Name"], data["Platform"]["Type"])
-            if "Platform" in data
-            else None,
-            latitude_gk4=data["Latitude"],
-            longitude_gk4=data["Longitude"],
+            name=name,
+            place=place,
+            point_id=int(point_id),
+            type=stop_type,
+            arrival_scheduled=_parse_time(arrival),
+            arrival_state=_to_punctuality(arrival_state) if arrival_state is not None else None,
+            arrival_realtime=_parse_time(arrival_realtime) if arrival_realtime is not None else None,
+            departure_scheduled=_parse_time(departure),
+            departure_state=_to_punctuality(departure_state) if departure_state is not None else None,
+            departure_realtime=_parse_time(departure_realtime) if departure_realtime is not None else None,
+            platform=RouteStop.Platform(platform["Name"], platform["Type"]) if platform is not None else None,
+            latitude_gk4=latitude,
+            longitude_gk4=longitude,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PartialRoute:
     id: Optional[int]
     """Internal API id of this subroute"""
@@ -186,8 +239,8 @@ class PartialRoute:
             next_departures=[_parse_time(td) for td in data.get("NextDepartureTimes", [])],
             previous_departures=[_parse_time(td) for td in data.get("PreviousDepartureTimes", [])],
         )
-        if partial.duration is None and len(partial.stops) > 0:
-            partial.duration = round((partial.stops[-1].arrival - partial.stops[0].departure).total_seconds / 60)
+        if partial.duration is None and partial.stops:
+            partial.duration = round((partial.stops[-1].arrival - partial.stops[0].departure).total_seconds() / 60)
         return partial
 
 
@@ -205,6 +258,7 @@ class Route:
         self.duration = data["Duration"]
         self.interchanges = data["Interchanges"]
         self.partial_routes = [PartialRoute.from_data(d) for d in data["PartialRoutes"]]
+        RouteStop._share_locations([s for pr in self.partial_routes for s in pr.stops])
         self.vehicles = [Vehicle.from_data(d) for d in data["MotChain"]]
 
 
@@ -237,13 +291,10 @@ def find_routes(start: Union[Point, int], destination: Union[Point, int], **kwar
 
     settings = {"maxChanges": kwargs.pop("max_changes", "Unlimited")}
     if "vehicle" in kwargs:
-        for idx, v in enumerate(kwargs["vehicle"]):
-            if isinstance(v, TransportationType):
-                kwargs["vehicle"][idx] = v.value
-        settings["mot"] = kwargs.pop("vehicle")
+        settings["mot"] = _serialize_vehicles(kwargs.pop("vehicle"))
 
-    if "time" in kwargs and isinstance(kwargs["time"], datetime):
-        kwargs["time"] = kwargs["time"].isoformat()
+    if "time" in kwargs:
+        kwargs["time"] = _coerce_time(kwargs["time"])
 
     return _do_request(
         _ENDPOINT,
@@ -4,25 +4,15 @@ from .base import Response, _do_request
 
 
 class Point:
+    __slots__ = ("data", "id", "type", "place", "name", "gk4_right", "gk4_up", "distance", "_", "shortcut")
+
     def __init__(self, data: str) -> None:
         self.data = data
-        (
-            self.id,
-            self.type,
-            self.place,
-            self.name,
-            self.gk4_right,
-            self.gk4_up,
-            self.distance,
-            self._,
-            self.shortcut,
-        ) = data.split("|")
-        if self.is_stop:
-            self.id = int(self.id)
-        if self.distance:
-            self.distance = int(self.distance)
-        self.gk4_right = int(self.gk4_right)
-        self.gk4_up = int(self.gk4_up)
+        pid, self.type, self.place, self.name, right, up, distance, self._, self.shortcut = data.split("|")
+        self.id = int(pid) if self.type == "" and pid.isdecimal() else pid
+        self.distance = int(distance) if distance else distance
+        self.gk4_right = int(right)
+        self.gk4_up = int(up)
 
     @property
     def location(self):
@@ -37,7 +27,7 @@ class Point:
     @property
     def is_stop(self):
         """If this point is a stop"""
-        return self.type == "" and (isinstance(self.id, int) or (isinstance(self.id, str) and self.id.isnumeric))
+        return self.type == "" and (isinstance(self.id, int) or (isinstance(self.id, str) and self.id.isdecimal()))
 
     def __repr__(self) -> str:
         return f"Point({self.data})"
@@ -50,7 +40,7 @@ class PointResponse(Response):
         super().__init__(data, parameters)
         self.ok = self.status and data["PointStatus"] != "NotIdentified"
         if self.ok:
-            self.points = [Point(p) for p in data["Points"]]
+            self.points = list(map(Point, data["Points"]))
 
 
 def find_points(
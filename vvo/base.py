@@ -1,12 +1,22 @@
 import requests as _requests
-import re as _re
+from requests.adapters import HTTPAdapter as _HTTPAdapter
 from datetime import datetime
 from logging import getLogger as _getLogger
+from typing import Union
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
 
 _BASE_URL = "https://webapi.vvo-online.de/"
 
 logger = _getLogger()
 
+_SESSION = _requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount("https://", _HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 
 class Response:
     def __init__(self, data, parameters):
@@ -20,26 +30,47 @@ def _do_request(endpoint: str, data: dict = None, cls=Response):
     if not issubclass(cls, Response):
         raise ValueError("Class must be derived from Response class")
 
-    r = _requests.post(f"{_BASE_URL}{endpoint}", json=data)
+    r = _SESSION.post(f"{_BASE_URL}{endpoint}", data=_json_dumps(data))
     if r.status_code != 200:
         logger.debug(f"Request to {endpoint} failed with status code {r.status_code}")
         try:
-            status = r.json()["Status"]
+            status = _json_loads(r.content)["Status"]
             raise RuntimeError(f"{status['Code']}: {status['Message']}")
-        except (_requests.exceptions.JSONDecodeError, KeyError):
+        except (ValueError, KeyError):
             pass
         raise RuntimeError
 
-    return cls(r.json(), data)
+    return cls(_json_loads(r.content), data)
+
+
+def close():
+    """Close pooled connections to the API"""
+
+    _SESSION.close()
 
 
 def _parse_time(time: str):
     """Parse time string to datetime"""
 
-    pattern = _re.compile(r"Date\((\d+)+?([-]\d{4})\)")
-    res = pattern.search(time)
-    if not res:
-        raise ValueError("Invalid date string given")
+    try:
+        start = time.index("(") + 1
+        # The API always sends -0000, so skip the timezone in that case
+        if time.endswith("-0000)/"):
+            return datetime.fromtimestamp(int(time[start:-7]) / 1000)
+        end = time.index(")", start)
+        ts = int(time[start : end - 5])
+        tz = int(time[end - 5 : end])
+    except ValueError:
+        raise ValueError("Invalid date string given") from None
+    return datetime.fromtimestamp(ts / 1000 + tz * 60)
+
+
+def _coerce_time(time: Union[datetime, str]) -> str:
+    """Normalize a user supplied time to an ISO 8601 string"""
 
-    ts, tz = res.group(1, 2)
-    return datetime.fromtimestamp(int(ts) / 1000 + int(tz) * 60)
+    if isinstance(time, datetime):
+        return time.isoformat()
+    # fromisoformat only accepts the Z suffix since Python 3.11
+    if time.endswith(("Z", "z")):
+        time = time[:-1] + "+00:00"
+    return datetime.fromisoformat(time).isoformat()
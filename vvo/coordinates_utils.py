@@ -1,14 +1,45 @@
-from pyproj import Proj
+from functools import lru_cache
+from numbers import Real as _Real
 
-# EPSG:5678
-projection = Proj(
-    "+proj=tmerc +lat_0=0 +lon_0=12 +k=1 +x_0=4500000 +y_0=0 +ellps=bessel +towgs84=598.1,73.7,418.2,0.202,0.045,-2.455,6.7 +units=m +no_defs"
-)
+_PROJ = None
+
+
+def _get_proj():
+    """Create the EPSG:5678 projection on first use, importing pyproj is slow"""
+    global _PROJ
+    if _PROJ is None:
+        from pyproj import Proj
+
+        # EPSG:5678
+        _PROJ = Proj(
+            "+proj=tmerc +lat_0=0 +lon_0=12 +k=1 +x_0=4500000 +y_0=0 +ellps=bessel +towgs84=598.1,73.7,418.2,0.202,0.045,-2.455,6.7 +units=m +no_defs"
+        )
+    return _PROJ
+
+
+@lru_cache(maxsize=4096)
+def _fwd(lon, lat):
+    return _get_proj()(lon, lat)
+
+
+@lru_cache(maxsize=4096)
+def _inv(right, up):
+    return _get_proj()(up, right, inverse=True)
 
 
 def to_gk4(lon, lat):
-    return projection(lon, lat)
+    # Only scalars are cached, sequences and arrays are passed to pyproj as they are
+    if isinstance(lon, _Real) and isinstance(lat, _Real):
+        return _fwd(lon, lat)
+    return _get_proj()(lon, lat)
 
 
 def from_gk4(right, up):
-    return projection(up, right, inverse=True)
+    if isinstance(right, _Real) and isinstance(up, _Real):
+        return _inv(right, up)
+    return _get_proj()(up, right, inverse=True)
+
+
+def from_gk4_bulk(right, up):
+    """Like `from_gk4` but for sequences of coordinates, returns lists of longitudes and latitudes"""
+    return _get_proj()(list(up), list(right), inverse=True)